@@ -22,6 +22,18 @@ def build_executable():
     # Create necessary directories
     (project_root / "output").mkdir(exist_ok=True)
     
+    # Precompile Numba kernels so the first run skips JIT compilation
+    print("Compiling AOT kernels...")
+    result = subprocess.run(
+        [sys.executable, "-m", "core._halftone_aot"],
+        cwd=src_dir,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        print("AOT compilation failed, kernels will be JIT compiled at runtime")
+        print("STDERR:", result.stderr)
+    
     # PyInstaller command
     pyinstaller_cmd = [
         "pyinstaller",
@@ -0,0 +1,59 @@
+# src/core/_halftone_aot.py
+"""
+Build the ahead-of-time compiled kernel module (core/halftone_aot).
+Run from the src directory before packaging:
+
+    python -m core._halftone_aot
+
+Numba's AOT compiler does not support parallel=True, so these builds are
+single-threaded; they only cover the first calls while the parallel JIT
+kernels compile in the background (see core/aot.py).
+"""
+import os
+
+from numba.pycc import CC
+
+from .color_separation import (
+    APPLY_LUT_SIG,
+    RGB_TO_CMYK_SIG,
+    WHITE_MASK_SIG,
+    _apply_lut_kernel,
+    _rgb_to_cmyk_kernel,
+    _white_mask_kernel,
+)
+from .halftone_algorithms import (
+    ERROR_DIFFUSION_SIG,
+    ORDERED_DITHER_SIG,
+    _error_diffusion_wavefront,
+    _ordered_dither_kernel,
+)
+from .processor import (
+    COMPOSITE_SIG,
+    PREVIEW_SIG,
+    SEPARATE_AND_SCREEN_SIG,
+    _composite_white_kernel,
+    _preview_kernel,
+    _separate_and_screen_kernel,
+)
+
+cc = CC("halftone_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+
+KERNELS = [
+    ("error_diffusion_wavefront", ERROR_DIFFUSION_SIG, _error_diffusion_wavefront),
+    ("ordered_dither_kernel", ORDERED_DITHER_SIG, _ordered_dither_kernel),
+    ("rgb_to_cmyk_kernel", RGB_TO_CMYK_SIG, _rgb_to_cmyk_kernel),
+    ("white_mask_kernel", WHITE_MASK_SIG, _white_mask_kernel),
+    ("apply_lut_kernel", APPLY_LUT_SIG, _apply_lut_kernel),
+    ("preview_kernel", PREVIEW_SIG, _preview_kernel),
+    ("composite_white_kernel", COMPOSITE_SIG, _composite_white_kernel),
+    ("separate_and_screen_kernel", SEPARATE_AND_SCREEN_SIG, _separate_and_screen_kernel),
+]
+
+for name, signature, kernel in KERNELS:
+    cc.export(name, signature)(kernel.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print(f"Built {cc.name} in {cc.output_dir}")
@@ -0,0 +1,101 @@
+# src/core/aot.py
+import threading
+from queue import Queue
+from typing import Union
+
+import numba
+import numpy as np
+from numba.core import sigutils, types
+from numba.core.typing.templates import Signature
+from numba.np import numpy_support
+
+# Ahead-of-time compiled kernels, built by core/_halftone_aot.py
+try:
+    from . import halftone_aot as _aot_module
+except ImportError:
+    _aot_module = None
+
+# Launch Numba's thread pool from the importing (main) thread. A pool first
+# started from a worker thread (QThread, ThreadPoolExecutor) can hang
+# interpreter shutdown with the TBB threading layer.
+numba.get_num_threads()
+
+_warmup_queue = Queue()
+_warmup_thread = None
+_warmup_lock = threading.Lock()
+
+
+class AOTKernel:
+    """
+    Numba kernel with an ahead-of-time compiled stand-in.
+    The AOT build (single-threaded, holds the GIL) serves calls until the
+    parallel JIT version has been compiled in the background.
+    """
+    
+    def __init__(self, name: str, kernel, signature: Union[str, Signature]):
+        self.name = name
+        self.kernel = kernel
+        self.signature = signature
+        self.aot = getattr(_aot_module, name, None)
+        self._array_args = _array_specs(signature)
+        
+        if self.aot is not None:
+            _warm_up(kernel, signature)
+    
+    def __call__(self, *args):
+        if self.aot is None or self.kernel.signatures or not self._fits_aot(args):
+            return self.kernel(*args)
+        return self.aot(*args)
+    
+    def _fits_aot(self, args) -> bool:
+        """
+        The AOT exports trust their signature and do not check layout:
+        a strided view would be addressed as if it were contiguous.
+        Anything that is not an exact match goes to the JIT instead.
+        """
+        for index, ndim, dtype, contiguous, mutable in self._array_args:
+            arr = args[index]
+            if not (isinstance(arr, np.ndarray)
+                    and arr.ndim == ndim
+                    and arr.dtype == dtype
+                    and (arr.flags.c_contiguous or not contiguous)
+                    and (arr.flags.writeable or not mutable)):
+                return False
+        return True
+
+
+def _array_specs(signature: Union[str, Signature]):
+    """(index, ndim, dtype, C-contiguous, mutable) for each array argument"""
+    args, _ = sigutils.normalize_signature(signature)
+    return tuple(
+        (index, arg.ndim, numpy_support.as_dtype(arg.dtype), arg.layout == "C", arg.mutable)
+        for index, arg in enumerate(args)
+        if isinstance(arg, types.Array)
+    )
+
+
+def _warm_up(kernel, signature: Union[str, Signature]):
+    """Queue a JIT kernel for compilation on a background thread"""
+    global _warmup_thread
+    
+    _warmup_queue.put((kernel, signature))
+    
+    with _warmup_lock:
+        # Daemon thread, so closing the app never waits for the compiler
+        if _warmup_thread is None:
+            _warmup_thread = threading.Thread(
+                target=_warmup_worker,
+                name="numba-warmup",
+                daemon=True
+            )
+            _warmup_thread.start()
+
+
+def _warmup_worker():
+    while True:
+        kernel, signature = _warmup_queue.get()
+        try:
+            kernel.compile(signature)
+        except Exception as e:
+            # The AOT build keeps serving calls; the JIT compiles lazily later
+            print(f"Kernel warm-up failed: {e}")
@@ -2,6 +2,144 @@
 import numpy as np
 from typing import Tuple, Dict
 import colorsys
+import functools
+from numba import njit, prange, types
+
+from .aot import AOTKernel
+
+# OpenCV is only needed for the edge-enhanced white layer
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Kernel signatures shared by the JIT warm-up and the AOT build
+RGB_TO_CMYK_SIG = (
+    "void(uint8[:, :, ::1], uint8[:, ::1], uint8[:, ::1], uint8[:, ::1], "
+    "uint8[:, ::1], float32, boolean)"
+)
+WHITE_MASK_SIG = "void(uint8[:, :, ::1], int32, uint8[:, ::1], boolean, uint8[:, ::1])"
+APPLY_LUT_SIG = types.void(
+    types.uint8[:, ::1],
+    types.Array(types.uint8, 1, "C", readonly=True),
+    types.uint8[:, ::1]
+)
+
+
+# GCR keeps 80% of the gray component as black (205/256 ~ 0.8)
+GCR_BLACK_Q8 = 205
+
+# 16.16 fixed point reciprocals 255 / (255 - k) for the GCR renormalization
+_GCR_RECIPROCAL = np.round(
+    65536.0 * 255.0 / np.maximum(255.0 - np.arange(256), 1.0)
+).astype(np.int32)
+_GCR_RECIPROCAL.flags.writeable = False
+
+
+@njit(nogil=True, cache=True)
+def _cmyk_pixel(r, g, b, limit_q, use_gcr):
+    """CMYK of one RGB pixel on the 0-255 scale, ink limited to limit_q"""
+    # Calculate CMY
+    c = 255 - np.int32(r)
+    m = 255 - np.int32(g)
+    y = 255 - np.int32(b)
+    
+    # Black generation
+    k = min(c, m, y)
+    if use_gcr:
+        # Gray Component Replacement: (x - k) / (1 - k) via reciprocal LUT
+        k = (k * GCR_BLACK_Q8 + 128) >> 8
+        inv = _GCR_RECIPROCAL[k]
+        c = ((c - k) * inv + 32768) >> 16
+        m = ((m - k) * inv + 32768) >> 16
+        y = ((y - k) * inv + 32768) >> 16
+    else:
+        # Under Color Removal
+        c -= k
+        m -= k
+        y -= k
+    
+    # Apply total ink limit (branchless: scale is 1.0 below the limit)
+    scale = (limit_q << 16) // max(c + m + y + k, limit_q, 1)
+    c = min((c * scale + 32768) >> 16, 255)
+    m = min((m * scale + 32768) >> 16, 255)
+    y = min((y * scale + 32768) >> 16, 255)
+    k = min((k * scale + 32768) >> 16, 255)
+    return c, m, y, k
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _rgb_to_cmyk_kernel(rgb, out_c, out_m, out_y, out_k, limit, use_gcr):
+    """Fused CMYK separation, black generation and total ink limit (fixed point)"""
+    h, w = out_k.shape
+    # Ink limit on the 0-255 per channel scale
+    limit_q = np.int32(limit * 255.0 + 0.5)
+    
+    for row in prange(h):
+        for col in range(w):
+            c, m, y, k = _cmyk_pixel(
+                rgb[row, col, 0], rgb[row, col, 1], rgb[row, col, 2], limit_q, use_gcr
+            )
+            out_c[row, col] = np.uint8(c)
+            out_m[row, col] = np.uint8(m)
+            out_y[row, col] = np.uint8(y)
+            out_k[row, col] = np.uint8(k)
+
+
+# Placeholder edge map for white layer methods without edge detection
+_NO_EDGES = np.zeros((1, 1), dtype=np.uint8)
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def _white_mask_kernel(rgb, limit, edges, use_edges, out):
+    """White ink where the BT.601 luma is below limit (or next to an edge)"""
+    h, w = out.shape
+    
+    for row in prange(h):
+        r0 = max(row - 1, 0)
+        r1 = min(row + 2, h)
+        for col in range(w):
+            # Integer luma (77R + 150G + 29B) >> 8, as OpenCV's RGB2GRAY
+            luma = (np.int32(77) * rgb[row, col, 0] + np.int32(150) * rgb[row, col, 1]
+                    + np.int32(29) * rgb[row, col, 2]) >> 8
+            needed = luma < limit
+            if use_edges and not needed:
+                # 3x3 dilation of the edge map, fused into the threshold pass
+                c0 = max(col - 1, 0)
+                c1 = min(col + 2, w)
+                for er in range(r0, r1):
+                    for ec in range(c0, c1):
+                        if edges[er, ec] > 0:
+                            needed = True
+            out[row, col] = 255 if needed else 0
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _apply_lut_kernel(channel, lut, out):
+    """8-bit LUT lookup; out may alias channel"""
+    h, w = channel.shape
+    
+    for row in prange(h):
+        for col in range(w):
+            out[row, col] = lut[channel[row, col]]
+
+
+_rgb_to_cmyk = AOTKernel("rgb_to_cmyk_kernel", _rgb_to_cmyk_kernel, RGB_TO_CMYK_SIG)
+_white_mask = AOTKernel("white_mask_kernel", _white_mask_kernel, WHITE_MASK_SIG)
+_apply_lut = AOTKernel("apply_lut_kernel", _apply_lut_kernel, APPLY_LUT_SIG)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_dg_lut(dot_gain_q: int) -> np.ndarray:
+    """Inverse dot gain LUT for a dot gain quantized to 1/1000"""
+    dot_gain = dot_gain_q / 1000.0
+    x = np.linspace(0, 1, 256)
+    # Inverse dot gain curve
+    y = 1 - (1 - x) ** (1 / (1 + dot_gain))
+    lut = (y * 255).astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
+
 
 class DTFColorSeparator:
     """DTF-specific color separation with white layer generation"""
@@ -9,52 +147,29 @@ class DTFColorSeparator:
     def __init__(self, config):
         self.config = config
     
-    def rgb_to_cmyk(self, rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    def rgb_to_cmyk(
+        self,
+        rgb: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
         """
         Convert RGB to CMYK with proper black generation
-        Returns: (cmyk_array, black_channel)
+        Returns: (cyan, magenta, yellow, black) as separate contiguous planes
         """
-        # Normalize RGB
-        rgb_norm = rgb.astype(np.float32) / 255.0
-        
-        # Calculate CMY
-        c = 1.0 - rgb_norm[:, :, 0]
-        m = 1.0 - rgb_norm[:, :, 1]
-        y = 1.0 - rgb_norm[:, :, 2]
-        
-        # Black generation
-        if self.config.black_generation == "GCR":
-            # Gray Component Replacement
-            k = np.minimum(np.minimum(c, m), y) * 0.8
-            k = np.clip(k, 0, 1)
-            
-            # Adjust CMY
-            c = (c - k) / (1.0 - k + 1e-10)
-            m = (m - k) / (1.0 - k + 1e-10)
-            y = (y - k) / (1.0 - k + 1e-10)
-        else:
-            # Under Color Removal
-            k = np.minimum(np.minimum(c, m), y)
-            c = c - k
-            m = m - k
-            y = y - k
-        
-        # Apply total ink limit
-        total_ink = c + m + y + k
-        mask = total_ink > (self.config.total_ink_limit / 100.0)
+        rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
+        h, w = rgb.shape[:2]
+        cyan, magenta, yellow, black = np.empty((4, h, w), dtype=np.uint8)
         
-        if np.any(mask):
-            scale = (self.config.total_ink_limit / 100.0) / total_ink[mask]
-            c[mask] *= scale
-            m[mask] *= scale
-            y[mask] *= scale
-            k[mask] *= scale
+        _rgb_to_cmyk(
+            rgb,
+            cyan,
+            magenta,
+            yellow,
+            black,
+            np.float32(self.config.total_ink_limit / 100.0),
+            self.config.black_generation == "GCR"
+        )
         
-        # Stack and convert to 0-255
-        cmyk = np.stack([c, m, y, k], axis=-1)
-        cmyk = np.clip(cmyk, 0, 1) * 255
-        
-        return cmyk.astype(np.uint8), (k * 255).astype(np.uint8)
+        return cyan, magenta, yellow, black
     
     def generate_white_layer(
         self,
@@ -65,72 +180,77 @@ class DTFColorSeparator:
         if method is None:
             method = self.config.white_method
         
+        rgb = np.ascontiguousarray(rgb, dtype=np.uint8)
         h, w, _ = rgb.shape
         
         if method == "full":
             # Full coverage under all colored areas
-            gray = np.mean(rgb, axis=2)
-            white = (gray < 250) * 255  # Almost white areas don't need white ink
+            # Almost white areas (luma >= 250) don't need white ink
+            white = np.empty((h, w), dtype=np.uint8)
+            _white_mask(rgb, np.int32(250), _NO_EDGES, False, white)
         
         elif method == "halftone":
             # Halftoned white layer to save ink
-            gray = np.mean(rgb, axis=2)
-            # Areas that need some white
-            white_needed = (gray < 220)
-            # Create density map
-            density = 1.0 - (gray / 255.0)
-            density = np.clip(density, 0, 1)
-            # Apply threshold
-            white = (density > 0.3) * 255
+            # Density 1 - luma/255 above 0.3, i.e. luma below 178.5
+            white = np.empty((h, w), dtype=np.uint8)
+            _white_mask(rgb, np.int32(179), _NO_EDGES, False, white)
         
         elif method == "edge_enhanced":
             # Enhanced edges for better definition
-            import cv2
+            if cv2 is None:
+                raise ImportError("Edge-enhanced white layer requires OpenCV (cv2)")
             
             # Convert to grayscale
             gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
             
-            # Detect edges
+            # Detect edges (the kernel dilates them by one pixel)
             edges = cv2.Canny(gray, 50, 150)
-            edges = cv2.dilate(edges, np.ones((3, 3), np.uint8), iterations=1)
-            
-            # Base white mask
-            brightness = np.mean(rgb, axis=2)
-            base_white = (brightness < 220)
             
-            # Combine with edges
-            white_mask = base_white | (edges > 0)
-            white = white_mask * 255
+            # Base white mask (luma < 220) combined with edges
+            white = np.empty((h, w), dtype=np.uint8)
+            _white_mask(rgb, np.int32(220), edges, True, white)
         
         elif method == "transparency_based":
             # For images with alpha channel
             if rgb.shape[2] == 4:
                 alpha = rgb[:, :, 3]
                 # White under semi-transparent areas
-                white = (alpha < 250) * 255
+                white = np.where(alpha < 250, np.uint8(255), np.uint8(0))
             else:
-                white = np.ones((h, w), dtype=np.uint8) * 255
+                white = np.full((h, w), 255, dtype=np.uint8)
         
         else:
             # Custom method
-            white = np.ones((h, w), dtype=np.uint8) * 255
+            white = np.full((h, w), 255, dtype=np.uint8)
         
-        return white.astype(np.uint8)
+        return white
     
     def apply_dot_gain_compensation(
         self,
         channel: np.ndarray,
-        dot_gain: float = None
+        dot_gain: float = None,
+        out: np.ndarray = None
     ) -> np.ndarray:
-        """Apply dot gain compensation curve"""
+        """Apply dot gain compensation curve (in place if out is channel)"""
         if dot_gain is None:
             dot_gain = self.config.dot_gain
         
-        # Create compensation LUT
-        x = np.linspace(0, 1, 256)
-        # Inverse dot gain curve
-        y = 1 - (1 - x) ** (1 / (1 + dot_gain))
-        lut = (y * 255).astype(np.uint8)
+        channel = np.ascontiguousarray(channel, dtype=np.uint8)
+        lut = _build_dg_lut(round(dot_gain * 1000))
+        if out is None:
+            out = np.empty_like(channel)
+        elif out.shape != channel.shape or out.dtype != np.uint8:
+            raise ValueError(
+                f"out must be a uint8 array of shape {channel.shape}, "
+                f"got {out.dtype} {out.shape}"
+            )
+        elif not out.flags.c_contiguous:
+            # The kernel writes rows contiguously; go through a temporary
+            result = np.empty_like(channel)
+            _apply_lut(channel, lut, result)
+            np.copyto(out, result)
+            return out
         
-        # Apply LUT
-        return lut[channel]
\ No newline at end of file
+        # Apply cached compensation LUT
+        _apply_lut(channel, lut, out)
+        return out
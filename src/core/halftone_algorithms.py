@@ -1,36 +1,168 @@
 # src/core/halftone_algorithms.py
+import functools
 import numpy as np
-from numba import jit
+from numba import njit, prange, types
 from typing import Tuple, Optional
 
+from .aot import AOTKernel
+
+# Wavefront tiling for parallel error diffusion
+FS_STRIP_HEIGHT = 64
+FS_BLOCK_WIDTH = 64
+
+# Rational tangent screens: the rotation vector is rounded to integers
+# of this length, which makes the rotated screen periodic (see threshold_tile)
+SCREEN_VECTOR_LENGTH = 16
+SCREEN_TILE_SIZE = 256
+
+# Placeholder screen for pure error diffusion (never sampled)
+_NO_SCREEN = np.zeros((1, 1), dtype=np.uint8)
+_NO_SCREEN.flags.writeable = False
+
+
+@njit(fastmath=True, nogil=True, cache=True)
+def _fs_block(output, channel, screen, lo, hi, y0, y1, b):
+    """
+    Serial error diffusion over one skewed block of a strip.
+    Pixels whose source value lies in [lo, hi] are screened against the
+    pre-rotated threshold tile instead and do not diffuse any error.
+    """
+    h, w = output.shape
+    tile_h, tile_w = screen.shape
+    
+    for y in range(y0, y1):
+        # Each row is shifted 2 columns left so the row above is always ahead
+        x0 = b * FS_BLOCK_WIDTH - 2 * (y - y0)
+        x1 = x0 + FS_BLOCK_WIDTH
+        if x0 < 0:
+            x0 = 0
+        if x1 > w:
+            x1 = w
+        
+        for x in range(x0, x1):
+            value = channel[y, x]
+            if value >= lo and value <= hi:
+                # AM screening for midtones
+                output[y, x] = 255.0 if value > screen[y & (tile_h - 1), x & (tile_w - 1)] else 0.0
+                continue
+            
+            old_pixel = output[y, x]
+            new_pixel = 255.0 if old_pixel > 127.5 else 0.0
+            output[y, x] = new_pixel
+            error = old_pixel - new_pixel
+            
+            # Diffuse error to neighbors
+            if x + 1 < w:
+                output[y, x + 1] += error * 7.0 / 16.0
+            if y + 1 < h:
+                if x > 0:
+                    output[y + 1, x - 1] += error * 3.0 / 16.0
+                output[y + 1, x] += error * 5.0 / 16.0
+                if x + 1 < w:
+                    output[y + 1, x + 1] += error * 1.0 / 16.0
+
+
+# Kernel signatures shared by the JIT warm-up and the AOT build
+ERROR_DIFFUSION_SIG = types.void(
+    types.float32[:, ::1],
+    types.uint8[:, ::1],
+    types.Array(types.uint8, 2, "C", readonly=True),
+    types.float32,
+    types.float32
+)
+ORDERED_DITHER_SIG = types.void(
+    types.uint8[:, ::1],
+    types.Array(types.uint8, 2, "C", readonly=True),
+    types.uint8[:, ::1]
+)
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def _error_diffusion_wavefront(output, channel, screen, lo, hi):
+    """
+    In-place Floyd-Steinberg (optionally hybrid) over a float32 image.
+    Strips of rows run concurrently, each lagging the strip above by a
+    few blocks so every pixel sees exactly the serial error sequence.
+    """
+    h, w = output.shape
+    n_strips = (h + FS_STRIP_HEIGHT - 1) // FS_STRIP_HEIGHT
+    n_blocks = (w + 2 * (FS_STRIP_HEIGHT - 1) + FS_BLOCK_WIDTH - 1) // FS_BLOCK_WIDTH
+    lag = (2 * FS_STRIP_HEIGHT - 1) // FS_BLOCK_WIDTH + 2
+    
+    for d in range(n_blocks + lag * (n_strips - 1)):
+        for s in prange(n_strips):
+            b = d - lag * s
+            if b >= 0 and b < n_blocks:
+                y0 = s * FS_STRIP_HEIGHT
+                y1 = min(y0 + FS_STRIP_HEIGHT, h)
+                _fs_block(output, channel, screen, lo, hi, y0, y1, b)
+
+
+@njit(parallel=True, fastmath=True, nogil=True, cache=True)
+def _ordered_dither_kernel(channel, tile, output):
+    """Threshold against a pre-rotated, power-of-two sized screen tile"""
+    h, w = channel.shape
+    tile_h, tile_w = tile.shape
+    
+    for y in prange(h):
+        for x in range(w):
+            output[y, x] = 255 if channel[y, x] > tile[y & (tile_h - 1), x & (tile_w - 1)] else 0
+
+
+_error_diffusion = AOTKernel(
+    "error_diffusion_wavefront",
+    _error_diffusion_wavefront,
+    ERROR_DIFFUSION_SIG
+)
+_ordered_dither = AOTKernel(
+    "ordered_dither_kernel",
+    _ordered_dither_kernel,
+    ORDERED_DITHER_SIG
+)
+
+
 class HalftoneAlgorithms:
     """Collection of halftoning algorithms optimized for performance"""
     
     @staticmethod
-    @jit(nopython=True, parallel=True)
+    @functools.lru_cache(maxsize=16)
     def bayer_matrix(size: int) -> np.ndarray:
-        """Generate Bayer ordered dithering matrix"""
-        if size == 2:
-            return np.array([[0, 2],
-                            [3, 1]], dtype=np.float32) / 4.0
-        
-        # Recursive generation for larger matrices
-        n = 2
+        """Generate Bayer ordered dithering matrix (cached, read-only)"""
         matrix = np.array([[0, 2],
-                          [3, 1]], dtype=np.float32)
+                           [3, 1]], dtype=np.float32)
         
-        while n < size:
-            n *= 2
-            new_matrix = np.zeros((n, n), dtype=np.float32)
-            
-            for i in range(2):
-                for j in range(2):
-                    quadrant = matrix + (i * 2 + j) * (n * n // 4)
-                    new_matrix[i*n//2:(i+1)*n//2, j*n//2:(j+1)*n//2] = quadrant
-            
-            matrix = new_matrix
+        # Recursive doubling for larger matrices
+        while matrix.shape[0] < size:
+            matrix = np.block([[4 * matrix, 4 * matrix + 2],
+                               [4 * matrix + 3, 4 * matrix + 1]])
         
-        return matrix / (size * size)
+        matrix = matrix / (size * size)
+        matrix.flags.writeable = False
+        return matrix
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def threshold_tile(matrix_size: int, angle: float) -> np.ndarray:
+        """
+        Rotated Bayer screen as a seamless uint8 tile (cached, read-only).
+        The rotation vector is rounded to integers of length ~16, which
+        snaps the angle to within 2 degrees but makes the screen repeat
+        exactly every 16 * matrix_size pixels.
+        """
+        theta = np.deg2rad(angle)
+        p = int(round(SCREEN_VECTOR_LENGTH * np.cos(theta)))
+        q = int(round(SCREEN_VECTOR_LENGTH * np.sin(theta)))
+        
+        size = max(SCREEN_TILE_SIZE, SCREEN_VECTOR_LENGTH * matrix_size)
+        y, x = np.mgrid[0:size, 0:size]
+        u = ((p * x + q * y) // SCREEN_VECTOR_LENGTH) & (matrix_size - 1)
+        v = ((p * y - q * x) // SCREEN_VECTOR_LENGTH) & (matrix_size - 1)
+        
+        # Thresholds scaled to the 0-255 input range
+        screen = HalftoneAlgorithms.bayer_matrix(matrix_size) * np.float32(255.0)
+        tile = screen[v, u].astype(np.uint8)
+        tile.flags.writeable = False
+        return tile
     
     @staticmethod
     def ordered_dither(
@@ -42,86 +174,55 @@ class HalftoneAlgorithms:
         Apply ordered dithering with rotation
         Optimized for large images
         """
-        h, w = channel.shape
-        
-        # Generate threshold matrix
-        threshold_matrix = HalftoneAlgorithms.bayer_matrix(matrix_size)
-        tm_h, tm_w = threshold_matrix.shape
+        # Pre-rotated threshold tile, built once per (size, angle)
+        tile = HalftoneAlgorithms.threshold_tile(matrix_size, angle)
         
-        # Normalize input to 0-1
-        normalized = channel.astype(np.float32) / 255.0
+        channel = np.ascontiguousarray(channel, dtype=np.uint8)
+        output = np.empty(channel.shape, dtype=np.uint8)
+        _ordered_dither(channel, tile, output)
         
-        # Tile threshold matrix
-        tiles_h = (h + tm_h - 1) // tm_h
-        tiles_w = (w + tm_w - 1) // tm_w
-        
-        tiled_matrix = np.tile(threshold_matrix, (tiles_h, tiles_w))
-        tiled_matrix = tiled_matrix[:h, :w]
-        
-        # Apply threshold
-        result = (normalized > tiled_matrix).astype(np.float32)
-        
-        # Rotate if angle != 0
-        if angle != 0:
-            from scipy import ndimage
-            result = ndimage.rotate(result, angle, reshape=False, order=1)
-        
-        return (result * 255).astype(np.uint8)
+        return output
     
     @staticmethod
-    @jit(nopython=True)
     def floyd_steinberg(channel: np.ndarray) -> np.ndarray:
         """Floyd-Steinberg error diffusion dithering"""
-        h, w = channel.shape
-        output = channel.copy().astype(np.float32)
-        
-        for y in range(h):
-            for x in range(w):
-                old_pixel = output[y, x]
-                new_pixel = 255.0 if old_pixel > 127.5 else 0.0
-                output[y, x] = new_pixel
-                error = old_pixel - new_pixel
-                
-                # Diffuse error to neighbors
-                if x + 1 < w:
-                    output[y, x + 1] += error * 7.0 / 16.0
-                if y + 1 < h:
-                    if x > 0:
-                        output[y + 1, x - 1] += error * 3.0 / 16.0
-                    output[y + 1, x] += error * 5.0 / 16.0
-                    if x + 1 < w:
-                        output[y + 1, x + 1] += error * 1.0 / 16.0
-        
+        channel = np.ascontiguousarray(channel, dtype=np.uint8)
+        output = channel.astype(np.float32)
+        # An empty [lo, hi] range disables the AM branch
+        _error_diffusion(
+            output,
+            channel,
+            _NO_SCREEN,
+            np.float32(1.0),
+            np.float32(0.0)
+        )
         return np.clip(output, 0, 255).astype(np.uint8)
     
     @staticmethod
     def hybrid_halftone(
         channel: np.ndarray,
         highlight_threshold: float = 0.2,
-        shadow_threshold: float = 0.8
+        shadow_threshold: float = 0.8,
+        matrix_size: int = 8,
+        angle: float = 45.0
     ) -> np.ndarray:
         """Hybrid AM/FM halftoning - AM for midtones, FM for highlights/shadows"""
-        normalized = channel.astype(np.float32) / 255.0
-        
-        # Create masks for different tonal ranges
-        highlight_mask = normalized < highlight_threshold
-        shadow_mask = normalized > shadow_threshold
-        midtone_mask = ~(highlight_mask | shadow_mask)
-        
-        # Initialize output
-        output = np.zeros_like(channel, dtype=np.uint8)
+        channel = np.ascontiguousarray(channel, dtype=np.uint8)
+        screen = HalftoneAlgorithms.threshold_tile(matrix_size, angle)
+        
+        # Single pass: midtones are screened, the rest error-diffused
+        output = channel.astype(np.float32)
+        _error_diffusion(
+            output,
+            channel,
+            screen,
+            np.float32(highlight_threshold * 255.0),
+            np.float32(shadow_threshold * 255.0)
+        )
         
-        # FM for highlights and shadows
-        if np.any(highlight_mask | shadow_mask):
-            fm_result = HalftoneAlgorithms.floyd_steinberg(channel)
-            output[highlight_mask | shadow_mask] = fm_result[highlight_mask | shadow_mask]
-        
-        # AM for midtones
-        if np.any(midtone_mask):
-            am_result = HalftoneAlgorithms.ordered_dither(
-                channel[midtone_mask].reshape(-1, 1),
-                matrix_size=8
-            )
-            output[midtone_mask] = am_result.flatten()
-        
-        return output
\ No newline at end of file
+        return np.clip(output, 0, 255).astype(np.uint8)
+
+
+# Warm the cache with the matrix sizes offered in the UI
+for _size in (2, 4, 8, 16):
+    HalftoneAlgorithms.bayer_matrix(_size)
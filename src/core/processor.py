@@ -1,12 +1,106 @@
 # src/core/processor.py
 import numpy as np
+import numba
+from numba import njit, prange, types
 from PIL import Image
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from queue import Queue
 from typing import Dict, List, Optional, Callable
 import os
 
+from .color_separation import DTFColorSeparator, _build_dg_lut, _cmyk_pixel
+from .aot import AOTKernel
+from .halftone_algorithms import HalftoneAlgorithms
+
+# OpenCV decodes most formats faster than Pillow; Pillow remains the fallback
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+# Kernel signatures shared by the JIT warm-up and the AOT build
+PREVIEW_SIG = "void(uint8[:, ::1], uint8[:, ::1], uint8[:, ::1], uint8[:, ::1], uint8[:, :, ::1])"
+COMPOSITE_SIG = types.void(
+    types.Array(types.uint8, 3, "C", readonly=True),
+    types.uint8[:, :, ::1]
+)
+SEPARATE_AND_SCREEN_SIG = types.void(
+    types.uint8[:, :, ::1],
+    types.Array(types.uint8, 1, "C", readonly=True),
+    types.uint8[:, :, ::1],
+    types.float32,
+    types.boolean,
+    types.uint8[:, :, ::1]
+)
+
+# Block size of the fused ordered pipeline (fits L2 with its intermediates)
+PIPELINE_TILE_SIZE = 256
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _preview_kernel(cyan, magenta, yellow, white, out):
+    """Simplified uint8 color mixing of halftoned channels"""
+    h, w = out.shape[:2]
+    
+    for y in prange(h):
+        for x in range(w):
+            # White ink makes colors brighter (77/256 ~ 0.3)
+            boost = (np.int32(white[y, x]) * 77) >> 8
+            out[y, x, 0] = min(255, 255 - np.int32(cyan[y, x]) + boost)     # Less cyan = more red
+            out[y, x, 1] = min(255, 255 - np.int32(magenta[y, x]) + boost)  # Less magenta = more green
+            out[y, x, 2] = min(255, 255 - np.int32(yellow[y, x]) + boost)   # Less yellow = more blue
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _composite_white_kernel(rgba, out):
+    """Composite RGBA over a white background with rounded integer math"""
+    h, w = out.shape[:2]
+    
+    for y in prange(h):
+        for x in range(w):
+            a = np.int32(rgba[y, x, 3])
+            background = 255 * (255 - a) + 127
+            for ch in range(3):
+                out[y, x, ch] = (np.int32(rgba[y, x, ch]) * a + background) // 255
+
+
+@njit(parallel=True, nogil=True, cache=True)
+def _separate_and_screen_kernel(rgb, lut, screens, limit, use_gcr, out):
+    """
+    CMYK separation, dot gain LUT and ordered screening fused per tile.
+    out[i] is the halftoned plane screened against screens[i].
+    """
+    h, w = rgb.shape[:2]
+    s_h, s_w = screens.shape[1:]
+    limit_q = np.int32(limit * 255.0 + 0.5)
+    tiles_y = (h + PIPELINE_TILE_SIZE - 1) // PIPELINE_TILE_SIZE
+    tiles_x = (w + PIPELINE_TILE_SIZE - 1) // PIPELINE_TILE_SIZE
+    
+    for t in prange(tiles_y * tiles_x):
+        y0 = (t // tiles_x) * PIPELINE_TILE_SIZE
+        x0 = (t % tiles_x) * PIPELINE_TILE_SIZE
+        for y in range(y0, min(y0 + PIPELINE_TILE_SIZE, h)):
+            sy = y & (s_h - 1)
+            for x in range(x0, min(x0 + PIPELINE_TILE_SIZE, w)):
+                sx = x & (s_w - 1)
+                c, m, ye, k = _cmyk_pixel(rgb[y, x, 0], rgb[y, x, 1], rgb[y, x, 2], limit_q, use_gcr)
+                out[0, y, x] = 255 if lut[c] > screens[0, sy, sx] else 0
+                out[1, y, x] = 255 if lut[m] > screens[1, sy, sx] else 0
+                out[2, y, x] = 255 if lut[ye] > screens[2, sy, sx] else 0
+                out[3, y, x] = 255 if lut[k] > screens[3, sy, sx] else 0
+
+
+_preview = AOTKernel("preview_kernel", _preview_kernel, PREVIEW_SIG)
+_separate_and_screen = AOTKernel(
+    "separate_and_screen_kernel",
+    _separate_and_screen_kernel,
+    SEPARATE_AND_SCREEN_SIG
+)
+_composite_white = AOTKernel("composite_white_kernel", _composite_white_kernel, COMPOSITE_SIG)
+
+
 class DTFProcessor:
     """Main processing engine with multi-threading support"""
     
@@ -15,6 +109,10 @@ class DTFProcessor:
         self.halftone_algorithms = HalftoneAlgorithms()
         self.color_separator = DTFColorSeparator(config)
         
+        # Build the rotated screen tiles for the configured channel angles
+        for angle in self.config.angles.values():
+            self.halftone_algorithms.threshold_tile(self.config.matrix_size, angle)
+        
         # Processing state
         self.is_processing = False
         self.current_progress = 0
@@ -27,24 +125,57 @@ class DTFProcessor:
     def load_image(self, path: str) -> Optional[np.ndarray]:
         """Load image from file with error handling"""
         try:
+            rgb = self._decode_cv2(path)
+            if rgb is not None:
+                self.original_image = rgb
+                return self.original_image
+            
             img = Image.open(path)
             
             # Convert to RGB if needed
             if img.mode == 'RGBA':
-                # Create white background for transparency
-                white_bg = Image.new('RGB', img.size, (255, 255, 255))
-                white_bg.paste(img, mask=img.split()[3])
-                img = white_bg
-            elif img.mode != 'RGB':
-                img = img.convert('RGB')
+                # Composite onto a white background for transparency
+                rgba = np.asarray(img)
+                rgb = np.empty(rgba.shape[:2] + (3,), dtype=np.uint8)
+                _composite_white(rgba, rgb)
+            else:
+                if img.mode != 'RGB':
+                    img = img.convert('RGB')
+                rgb = np.array(img)
             
-            self.original_image = np.array(img)
+            self.original_image = rgb
             return self.original_image
             
         except Exception as e:
             print(f"Error loading image: {e}")
             return None
     
+    def _decode_cv2(self, path: str) -> Optional[np.ndarray]:
+        """Decode 8-bit images with OpenCV; None defers to Pillow"""
+        if cv2 is None:
+            return None
+        
+        # IMREAD_UNCHANGED keeps alpha and, like Pillow, ignores EXIF orientation
+        arr = cv2.imread(path, cv2.IMREAD_UNCHANGED)
+        if arr is None or arr.dtype != np.uint8:
+            return None
+        
+        if arr.ndim == 2:
+            return cv2.cvtColor(arr, cv2.COLOR_GRAY2RGB)
+        
+        if arr.shape[2] == 4:
+            # Swap to RGBA in place, then composite onto white
+            cv2.cvtColor(arr, cv2.COLOR_BGRA2RGBA, dst=arr)
+            rgb = np.empty(arr.shape[:2] + (3,), dtype=np.uint8)
+            _composite_white(arr, rgb)
+            return rgb
+        
+        if arr.shape[2] == 3:
+            # Channel swap in place, no second image buffer
+            return cv2.cvtColor(arr, cv2.COLOR_BGR2RGB, dst=arr)
+        
+        return None
+    
     def process(
         self,
         image: np.ndarray,
@@ -59,69 +190,11 @@ class DTFProcessor:
         self.total_steps = 8  # Total steps in pipeline
         
         try:
-            # Step 1: Color separation
-            if progress_callback:
-                progress_callback(1, "Separating colors...")
-            
-            cmyk_array, black_channel = self.color_separator.rgb_to_cmyk(image)
-            
-            # Step 2: Generate white layer
-            if progress_callback:
-                progress_callback(2, "Generating white layer...")
-            
-            white_layer = self.color_separator.generate_white_layer(image)
-            
-            # Step 3: Apply dot gain compensation
-            if progress_callback:
-                progress_callback(3, "Applying dot gain compensation...")
-            
-            channels = {
-                'cyan': cmyk_array[:, :, 0],
-                'magenta': cmyk_array[:, :, 1],
-                'yellow': cmyk_array[:, :, 2],
-                'black': black_channel,
-                'white': white_layer
-            }
-            
-            # Apply dot gain to each channel
-            for name in channels:
-                if name != 'white':  # Usually no dot gain on white
-                    channels[name] = self.color_separator.apply_dot_gain_compensation(
-                        channels[name]
-                    )
-            
-            # Step 4-8: Halftone each channel
-            halftoned = {}
-            
-            # Process channels in parallel (simplified version)
-            channel_order = ['cyan', 'magenta', 'yellow', 'black', 'white']
-            
-            for i, name in enumerate(channel_order):
-                step_num = 4 + i
-                if progress_callback:
-                    progress_callback(step_num, f"Halftoning {name} channel...")
-                
-                angle = self.config.angles.get(name, 0.0)
-                
-                if self.config.method == 'ordered':
-                    halftoned[name] = self.halftone_algorithms.ordered_dither(
-                        channels[name],
-                        matrix_size=self.config.matrix_size,
-                        angle=angle
-                    )
-                elif self.config.method == 'error_diffusion':
-                    halftoned[name] = self.halftone_algorithms.floyd_steinberg(
-                        channels[name]
-                    )
-                elif self.config.method == 'hybrid':
-                    halftoned[name] = self.halftone_algorithms.hybrid_halftone(
-                        channels[name]
-                    )
-                else:
-                    # Default to ordered dithering
-                    halftoned[name] = self.halftone_algorithms.ordered_dither(
-                        channels[name]
-                    )
+            if self.config.method == 'ordered':
+                # Nothing carries across tiles, so the stages run fused per tile
+                halftoned = self._process_tiled(image, progress_callback)
+            else:
+                halftoned = self._process_channels(image, progress_callback)
             
             self.results = halftoned
             
@@ -136,6 +209,168 @@ class DTFProcessor:
         finally:
             self.is_processing = False
     
+    def _process_tiled(
+        self,
+        image: np.ndarray,
+        progress_callback: Optional[Callable] = None
+    ) -> Dict[str, np.ndarray]:
+        """Ordered pipeline: CMYK stages fused over cache-sized tiles"""
+        rgb = np.ascontiguousarray(image, dtype=np.uint8)
+        h, w = rgb.shape[:2]
+        
+        # Steps 1-5: Separate, compensate and screen CMYK in one pass
+        if progress_callback:
+            progress_callback(1, "Separating and screening colors...")
+        
+        process_colors = ['cyan', 'magenta', 'yellow', 'black']
+        screens = np.stack([
+            self.halftone_algorithms.threshold_tile(
+                self.config.matrix_size,
+                self.config.angles.get(name, 0.0)
+            )
+            for name in process_colors
+        ])
+        planes = np.empty((len(process_colors), h, w), dtype=np.uint8)
+        _separate_and_screen(
+            rgb,
+            _build_dg_lut(round(self.config.dot_gain * 1000)),
+            screens,
+            np.float32(self.config.total_ink_limit / 100.0),
+            self.config.black_generation == "GCR",
+            planes
+        )
+        halftoned = dict(zip(process_colors, planes))
+        
+        # Step 6: Generate white layer
+        if progress_callback:
+            progress_callback(6, "Generating white layer...")
+        
+        white_layer = self.color_separator.generate_white_layer(image)
+        
+        # Step 7: Halftone white (no dot gain on white)
+        if progress_callback:
+            progress_callback(7, "Halftoning white channel...")
+        
+        halftoned['white'] = self.halftone_algorithms.ordered_dither(
+            white_layer,
+            matrix_size=self.config.matrix_size,
+            angle=self.config.angles.get('white', 0.0)
+        )
+        
+        return halftoned
+    
+    def _process_channels(
+        self,
+        image: np.ndarray,
+        progress_callback: Optional[Callable] = None
+    ) -> Dict[str, np.ndarray]:
+        """Stage by stage pipeline with channels halftoned in parallel"""
+        # Step 1: Color separation
+        if progress_callback:
+            progress_callback(1, "Separating colors...")
+        
+        cyan, magenta, yellow, black = self.color_separator.rgb_to_cmyk(image)
+        
+        # Step 2: Generate white layer
+        if progress_callback:
+            progress_callback(2, "Generating white layer...")
+        
+        white_layer = self.color_separator.generate_white_layer(image)
+        
+        # Step 3: Apply dot gain compensation
+        if progress_callback:
+            progress_callback(3, "Applying dot gain compensation...")
+        
+        channels = {
+            'cyan': cyan,
+            'magenta': magenta,
+            'yellow': yellow,
+            'black': black,
+            'white': white_layer
+        }
+        
+        # Apply dot gain to each channel, in place on the fresh planes
+        for name in channels:
+            if name != 'white':  # Usually no dot gain on white
+                self.color_separator.apply_dot_gain_compensation(
+                    channels[name],
+                    out=channels[name]
+                )
+        
+        # Step 4-8: Halftone each channel
+        halftoned = {}
+        
+        # Process channels in parallel; the Numba kernels release the GIL
+        channel_order = ['cyan', 'magenta', 'yellow', 'black', 'white']
+        n_workers = self._channel_workers(len(channel_order))
+        kernel_threads = max(1, numba.config.NUMBA_NUM_THREADS // n_workers)
+        
+        if progress_callback:
+            progress_callback(4, "Halftoning channels...")
+        
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = {
+                pool.submit(
+                    self._halftone_channel,
+                    name,
+                    channels[name],
+                    kernel_threads
+                ): name
+                for name in channel_order
+            }
+            
+            # Progress is reported from this thread only, as channels finish
+            for done, future in enumerate(as_completed(futures)):
+                name = futures[future]
+                halftoned[name] = future.result()
+                if progress_callback:
+                    progress_callback(4 + done, f"Halftoned {name} channel")
+        
+        return {name: halftoned[name] for name in channel_order}
+    
+    def _channel_workers(self, n_channels: int) -> int:
+        """Number of channels to halftone concurrently"""
+        try:
+            layer = numba.threading_layer()
+        except ValueError:
+            layer = "workqueue"
+        
+        # The workqueue layer cannot launch parallel kernels from several threads
+        if layer == "workqueue":
+            return 1
+        
+        return max(1, min(n_channels, os.cpu_count() or 1))
+    
+    def _halftone_channel(
+        self,
+        name: str,
+        channel: np.ndarray,
+        kernel_threads: int
+    ) -> np.ndarray:
+        """Halftone one channel (runs in a worker thread)"""
+        # Split the Numba thread pool between concurrently running channels
+        numba.set_num_threads(kernel_threads)
+        
+        angle = self.config.angles.get(name, 0.0)
+        
+        if self.config.method == 'ordered':
+            return self.halftone_algorithms.ordered_dither(
+                channel,
+                matrix_size=self.config.matrix_size,
+                angle=angle
+            )
+        elif self.config.method == 'error_diffusion':
+            return self.halftone_algorithms.floyd_steinberg(channel)
+        elif self.config.method == 'hybrid':
+            return self.halftone_algorithms.hybrid_halftone(
+                channel,
+                matrix_size=self.config.matrix_size,
+                angle=angle
+            )
+        else:
+            # Default to ordered dithering
+            return self.halftone_algorithms.ordered_dither(channel)
+    
     def save_results(
         self,
         output_dir: str,
@@ -145,31 +380,49 @@ class DTFProcessor:
         if not self.results:
             raise ValueError("No results to save. Process image first.")
         
-        saved_files = []
         os.makedirs(output_dir, exist_ok=True)
         
-        for name, channel in self.results.items():
-            filename = os.path.join(output_dir, f"{base_name}_{name}.tiff")
-            
-            # Save as TIFF with LZW compression
-            img = Image.fromarray(channel)
-            img.save(
-                filename,
-                format='TIFF',
-                compression='tiff_lzw',
-                dpi=(self.config.dpi, self.config.dpi)
-            )
+        # Encode all files concurrently; PIL's codecs release the GIL
+        with ThreadPoolExecutor(max_workers=len(self.results) + 1) as pool:
+            futures = [
+                pool.submit(self._save_channel, output_dir, base_name, name, channel)
+                for name, channel in self.results.items()
+            ]
+            # Also save a composite preview
+            futures.append(pool.submit(self._save_preview, output_dir, base_name))
             
-            saved_files.append(filename)
-        
-        # Also save a composite preview
-        preview = self.create_preview()
-        preview_path = os.path.join(output_dir, f"{base_name}_preview.png")
-        Image.fromarray(preview).save(preview_path)
-        saved_files.append(preview_path)
+            # Keep the channel order and re-raise any save error
+            saved_files = [future.result() for future in futures]
         
         return saved_files
     
+    def _save_channel(
+        self,
+        output_dir: str,
+        base_name: str,
+        name: str,
+        channel: np.ndarray
+    ) -> str:
+        """Save one channel as TIFF (runs in a worker thread)"""
+        filename = os.path.join(output_dir, f"{base_name}_{name}.tiff")
+        
+        # Save as TIFF with LZW compression
+        img = Image.fromarray(channel)
+        img.save(
+            filename,
+            format='TIFF',
+            compression='tiff_lzw',
+            dpi=(self.config.dpi, self.config.dpi)
+        )
+        
+        return filename
+    
+    def _save_preview(self, output_dir: str, base_name: str) -> str:
+        """Save the composite preview as PNG (runs in a worker thread)"""
+        preview_path = os.path.join(output_dir, f"{base_name}_preview.png")
+        Image.fromarray(self.create_preview()).save(preview_path)
+        return preview_path
+    
     def create_preview(self) -> np.ndarray:
         """Create RGB preview from halftoned channels"""
         if not self.results:
@@ -180,23 +433,12 @@ class DTFProcessor:
         
         # Convert halftone dots to simulated RGB
         # This is a simplified simulation for preview only
-        preview = np.zeros((h, w, 3), dtype=np.float32)
-        
-        # Combine channels (simplified color mixing)
-        for name, channel in self.results.items():
-            channel_norm = channel.astype(np.float32) / 255.0
-            
-            if name == 'cyan':
-                preview[:, :, 0] += (1 - channel_norm)  # Less cyan = more red
-            elif name == 'magenta':
-                preview[:, :, 1] += (1 - channel_norm)  # Less magenta = more green
-            elif name == 'yellow':
-                preview[:, :, 2] += (1 - channel_norm)  # Less yellow = more blue
-            elif name == 'white':
-                # White ink makes colors brighter
-                brightness_boost = channel_norm * 0.3
-                preview += brightness_boost[:, :, np.newaxis]
-        
-        # Clip and convert to uint8
-        preview = np.clip(preview, 0, 1) * 255
-        return preview.astype(np.uint8)
\ No newline at end of file
+        preview = np.empty((h, w, 3), dtype=np.uint8)
+        _preview(
+            self.results['cyan'],
+            self.results['magenta'],
+            self.results['yellow'],
+            self.results['white'],
+            preview
+        )
+        return preview
@@ -0,0 +1,123 @@
+# src/core/simple_halftone.py
+"""
+Minimal versions of the core algorithms (see test_core.py).
+Parallel Numba kernels when Numba is installed, whole-array NumPy otherwise.
+"""
+import functools
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+from .halftone_algorithms import HalftoneAlgorithms
+
+
+@functools.lru_cache(maxsize=8)
+def _bayer(size: int) -> np.ndarray:
+    """Bayer thresholds scaled to 0-255 (cached, read-only)"""
+    # channel > t equals channel > floor(t) for integer channels,
+    # so the thresholds can stay in uint8 alongside the data
+    thresholds = np.floor(HalftoneAlgorithms.bayer_matrix(size) * np.float32(255.0)).astype(np.uint8)
+    thresholds.flags.writeable = False
+    return thresholds
+
+
+if njit is not None:
+    @njit(parallel=True, nogil=True, cache=True)
+    def _rgb_to_cmyk_kernel(rgb, out):
+        """Per-pixel fixed-point CMYK with full black generation"""
+        h, w = out.shape[:2]
+        
+        for y in prange(h):
+            for x in range(w):
+                r = np.int32(rgb[y, x, 0])
+                g = np.int32(rgb[y, x, 1])
+                b = np.int32(rgb[y, x, 2])
+                
+                # K = 255 - max(R, G, B); CMY = (max - RGB) * 255 / max
+                mx = max(r, max(g, b))
+                denom = max(mx, 1)
+                out[y, x, 0] = np.uint8((mx - r) * 255 // denom)
+                out[y, x, 1] = np.uint8((mx - g) * 255 // denom)
+                out[y, x, 2] = np.uint8((mx - b) * 255 // denom)
+                out[y, x, 3] = np.uint8(255 - mx)
+    
+    @njit(parallel=True, nogil=True, cache=True)
+    def _white_layer_kernel(rgb, threshold, out):
+        """White ink where the BT.601 luma is below threshold"""
+        h, w = out.shape
+        
+        for y in prange(h):
+            for x in range(w):
+                luma = (np.int32(77) * rgb[y, x, 0] + np.int32(150) * rgb[y, x, 1]
+                        + np.int32(29) * rgb[y, x, 2]) >> 8
+                out[y, x] = 255 if luma < threshold else 0
+    
+    @njit(parallel=True, nogil=True, cache=True)
+    def _ordered_dither_kernel(channel, thresholds, out):
+        """Threshold against a power-of-two Bayer matrix by modular lookup"""
+        h, w = out.shape
+        mask = thresholds.shape[0] - 1
+        
+        for y in prange(h):
+            for x in range(w):
+                out[y, x] = 255 if channel[y, x] > thresholds[y & mask, x & mask] else 0
+
+
+def rgb_to_cmyk(rgb: np.ndarray) -> np.ndarray:
+    """
+    Convert RGB to CMYK with full black generation
+    Returns: (H, W, 4) uint8 array
+    """
+    if njit is not None:
+        cmyk = np.empty(rgb.shape[:2] + (4,), dtype=np.uint8)
+        _rgb_to_cmyk_kernel(np.ascontiguousarray(rgb, dtype=np.uint8), cmyk)
+        return cmyk
+    
+    # Fixed point: (max - RGB) * 255 peaks at 65025, which fits uint16
+    rgb16 = rgb.astype(np.uint16)
+    mx = rgb16.max(axis=-1)
+    
+    cmyk = np.empty(rgb.shape[:2] + (4,), dtype=np.uint8)
+    np.subtract(np.uint8(255), mx, out=cmyk[..., 3], casting="unsafe")
+    
+    # CMY = (max - RGB) * 255 // max, zero for pure black
+    np.subtract(mx[..., None], rgb16, out=rgb16)
+    rgb16 *= np.uint16(255)
+    np.maximum(mx, np.uint16(1), out=mx)
+    rgb16 //= mx[..., None]
+    cmyk[..., :3] = rgb16
+    return cmyk
+
+
+def generate_white_layer(rgb: np.ndarray, threshold: int = 250) -> np.ndarray:
+    """White ink (255) wherever the BT.601 luma is below threshold"""
+    if njit is not None:
+        white = np.empty(rgb.shape[:2], dtype=np.uint8)
+        _white_layer_kernel(np.ascontiguousarray(rgb, dtype=np.uint8), threshold, white)
+        return white
+    
+    rgb16 = rgb.astype(np.uint16)
+    luma = rgb16[..., 0] * np.uint16(77)
+    luma += rgb16[..., 1] * np.uint16(150)
+    luma += rgb16[..., 2] * np.uint16(29)
+    luma >>= 8
+    
+    return np.where(luma < threshold, np.uint8(255), np.uint8(0))
+
+
+def ordered_dither(channel: np.ndarray, matrix_size: int = 8) -> np.ndarray:
+    """Threshold a uint8 channel against a tiled Bayer matrix"""
+    thresholds = _bayer(matrix_size)
+    
+    if njit is not None:
+        output = np.empty(channel.shape, dtype=np.uint8)
+        _ordered_dither_kernel(np.ascontiguousarray(channel, dtype=np.uint8), thresholds, output)
+        return output
+    
+    h, w = channel.shape
+    
+    tiled = np.tile(thresholds, (h // matrix_size + 1, w // matrix_size + 1))[:h, :w]
+    return np.where(channel > tiled, np.uint8(255), np.uint8(0))
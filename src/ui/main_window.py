@@ -1,11 +1,12 @@
 # src/ui/main_window.py
 import sys
 import os
+import time
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 import numpy as np
-from PIL import Image, ImageQt
+from PIL import Image
 
 # Import our core modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,26 +18,8 @@ class ModernButton(QPushButton):
     def __init__(self, text, icon=None, parent=None):
         super().__init__(text, parent)
         self.setMinimumHeight(32)
-        self.setStyleSheet("""
-            QPushButton {
-                background-color: #4a86e8;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                padding: 6px 12px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #3a76d8;
-            }
-            QPushButton:pressed {
-                background-color: #2a66c8;
-            }
-            QPushButton:disabled {
-                background-color: #cccccc;
-                color: #666666;
-            }
-        """)
+        # Styled by QPushButton#ModernButton in DTFMainWindow.STYLESHEET
+        self.setObjectName("ModernButton")
         
         if icon:
             self.setIcon(icon)
@@ -78,8 +61,31 @@ class ModernSlider(QWidget):
     def setValue(self, value):
         self.slider.setValue(value)
 
+def _tint_table(ink):
+    """Indexed8 color table fading from paper white (0) to full ink (255)"""
+    return [
+        qRgb(*(255 - value * (255 - c) // 255 for c in ink))
+        for value in range(256)
+    ]
+
 class ImagePreviewWidget(QWidget):
     """Widget for displaying and comparing images"""
+    
+    # Native QImage format per uint8 channel count (no conversion needed)
+    QIMAGE_FORMATS = {
+        1: QImage.Format_Grayscale8,
+        3: QImage.Format_RGB888,
+        4: QImage.Format_RGBA8888
+    }
+    
+    # Precomputed color tables for tinted single-channel previews
+    TINT_TABLES = {
+        'cyan': _tint_table((0, 255, 255)),
+        'magenta': _tint_table((255, 0, 255)),
+        'yellow': _tint_table((255, 255, 0)),
+        'black': _tint_table((0, 0, 0))
+    }
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.original_pixmap = None
@@ -87,37 +93,113 @@ class ImagePreviewWidget(QWidget):
         self.show_original = True
         self.zoom_factor = 1.0
         
+        # Scaled pixmaps are cached (64 MB) and keyed per source/zoom/label
+        QPixmapCache.setCacheLimit(65536)
+        self._scaled_keys = set()
+        
+        # Per-slot QImage buffers, refilled in place while the shape is unchanged
+        self._qimages = {}
+        
+        # Display-resolution copies of large pixmaps, keyed by source cacheKey
+        self._display_pixmaps = {}
+        self._display_extent = 0
+        
+        # Unfiltered scaling while zooming/resizing, smooth once idle for 80 ms
+        self._interactive = False
+        self._idle_timer = QTimer(self)
+        self._idle_timer.setSingleShot(True)
+        self._idle_timer.setInterval(80)
+        self._idle_timer.timeout.connect(self._end_interaction)
+        
+        # paintEvent fills every pixel, so Qt can skip erasing the background
+        self.setAttribute(Qt.WA_OpaquePaintEvent)
+        
         self.setMinimumSize(400, 300)
         
-    def set_images(self, original, processed):
-        """Set original and processed images"""
+    def set_images(self, original, processed, tint=None):
+        """
+        Set original and processed images
+        A 2D processed array is shown as grayscale, or tinted with the
+        named ink color (see TINT_TABLES)
+        """
         if original is not None:
-            # Convert numpy array to QPixmap
-            if isinstance(original, np.ndarray):
-                original = Image.fromarray(original)
-            
-            if isinstance(original, Image.Image):
-                original = ImageQt.ImageQt(original)
-            
-            self.original_pixmap = QPixmap.fromImage(original)
+            self._drop_scaled(self.original_pixmap)
+            self.original_pixmap = self._to_pixmap(original, 'original')
         
         if processed is not None:
-            if isinstance(processed, np.ndarray):
-                processed = Image.fromarray(processed)
-            
-            if isinstance(processed, Image.Image):
-                processed = ImageQt.ImageQt(processed)
-            
-            self.processed_pixmap = QPixmap.fromImage(processed)
+            self._drop_scaled(self.processed_pixmap)
+            self.processed_pixmap = self._to_pixmap(processed, 'processed', tint)
         
+        self._refresh_display_pixmaps()
         self.update()
     
+    def _refresh_display_pixmaps(self):
+        """Downsample the current pixmaps once to ~2x the widget extent"""
+        self._display_extent = max(self.width(), self.height()) * 2
+        self._display_pixmaps = {}
+        
+        for pixmap in (self.original_pixmap, self.processed_pixmap):
+            if pixmap is None:
+                continue
+            if max(pixmap.width(), pixmap.height()) > self._display_extent:
+                self._display_pixmaps[pixmap.cacheKey()] = pixmap.scaled(
+                    self._display_extent,
+                    self._display_extent,
+                    Qt.KeepAspectRatio,
+                    Qt.SmoothTransformation
+                )
+    
+    def _to_pixmap(self, image, slot, tint=None):
+        """Convert an ndarray, PIL image or QImage to a QPixmap"""
+        if isinstance(image, Image.Image):
+            image = np.asarray(image.convert('RGBA' if 'A' in image.mode else 'RGB'))
+        
+        if isinstance(image, np.ndarray):
+            image = self._fill_qimage(image, slot, tint)
+        
+        return QPixmap.fromImage(image)
+    
+    def _fill_qimage(self, arr, slot, tint=None):
+        """Copy an array into the slot's QImage in its native format"""
+        if arr.dtype != np.uint8:
+            if arr.dtype.kind == 'f':
+                # Float images are in [0, 1]
+                arr = np.clip(arr * 255.0 + 0.5, 0, 255).astype(np.uint8)
+            elif arr.dtype.kind == 'b':
+                arr = arr.astype(np.uint8) * np.uint8(255)
+            else:
+                arr = np.clip(arr, 0, 255).astype(np.uint8)
+        
+        h, w = arr.shape[:2]
+        channels = arr.shape[2] if arr.ndim == 3 else 1
+        if channels == 1 and tint is not None:
+            # Ink tint through a 256 entry color table, no per-pixel math
+            fmt = QImage.Format_Indexed8
+        else:
+            fmt = self.QIMAGE_FORMATS[channels]
+        
+        # Reallocate only when the shape or format changes
+        image = self._qimages.get(slot)
+        if image is None or (image.width(), image.height(), image.format()) != (w, h, fmt):
+            image = QImage(w, h, fmt)
+            self._qimages[slot] = image
+        if fmt == QImage.Format_Indexed8:
+            image.setColorTable(self.TINT_TABLES[tint])
+        
+        # Rows are padded to 32-bit boundaries (bytesPerLine)
+        bits = image.bits()
+        bits.setsize(image.sizeInBytes())
+        rows = np.frombuffer(bits, dtype=np.uint8).reshape(h, image.bytesPerLine())
+        np.copyto(rows[:, :w * channels].reshape(arr.shape), arr)
+        return image
+    
     def paintEvent(self, event):
         """Paint the widget"""
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
+        # Only the label text benefits from antialiasing; blits and rects do not
+        painter.setRenderHint(QPainter.TextAntialiasing)
         
-        # Fill background
+        # Fill background (covers the whole widget, see WA_OpaquePaintEvent)
         painter.fillRect(self.rect(), QColor(240, 240, 240))
         
         if self.show_original and self.original_pixmap:
@@ -125,30 +207,84 @@ class ImagePreviewWidget(QWidget):
         elif self.processed_pixmap:
             self.draw_pixmap(painter, self.processed_pixmap, "Processed")
     
+    def begin_interaction(self):
+        """Use fast scaling until the view has been idle for a moment"""
+        self._interactive = True
+        self._idle_timer.start()
+    
+    def _end_interaction(self):
+        self._interactive = False
+        self.update()
+    
+    def resizeEvent(self, event):
+        self.begin_interaction()
+        
+        # Rebuild the display pixmaps only once the widget outgrows them
+        if max(self.width(), self.height()) * 2 > self._display_extent:
+            for pixmap in (self.original_pixmap, self.processed_pixmap):
+                self._drop_scaled(pixmap)
+            self._refresh_display_pixmaps()
+        
+        super().resizeEvent(event)
+    
+    def _drop_scaled(self, pixmap):
+        """Remove cached scaled copies of a pixmap that is being replaced"""
+        if pixmap is None:
+            return
+        
+        prefix = f"{pixmap.cacheKey()}|"
+        for key in [k for k in self._scaled_keys if k.startswith(prefix)]:
+            QPixmapCache.remove(key)
+            self._scaled_keys.discard(key)
+    
     def draw_pixmap(self, painter, pixmap, label):
         """Draw pixmap centered with label"""
-        # Scale pixmap
-        scaled_pixmap = pixmap.scaled(
-            int(pixmap.width() * self.zoom_factor),
-            int(pixmap.height() * self.zoom_factor),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation
-        )
+        width = int(pixmap.width() * self.zoom_factor)
+        height = int(pixmap.height() * self.zoom_factor)
+        
+        # Scale from the display copy unless zoomed in past its resolution
+        source = self._display_pixmaps.get(pixmap.cacheKey(), pixmap)
+        if width > source.width() or height > source.height():
+            source = pixmap
         
         # Center in widget
-        x = (self.width() - scaled_pixmap.width()) // 2
-        y = (self.height() - scaled_pixmap.height()) // 2
+        x = (self.width() - width) // 2
+        y = (self.height() - height) // 2
         
         # Draw shadow
-        shadow_rect = QRect(x + 3, y + 3, scaled_pixmap.width(), scaled_pixmap.height())
+        shadow_rect = QRect(x + 3, y + 3, width, height)
         painter.fillRect(shadow_rect, QColor(0, 0, 0, 100))
         
-        # Draw pixmap
-        painter.drawPixmap(x, y, scaled_pixmap)
+        # Draw pixmap (smooth result cached per source pixmap and zoom level)
+        key = f"{pixmap.cacheKey()}|{self.zoom_factor:.4f}|{label}"
+        scaled_pixmap = QPixmapCache.find(key)
+        if scaled_pixmap is None and self._interactive:
+            # Scale on the fly into the widget; no intermediate pixmap
+            painter.save()
+            painter.setRenderHint(QPainter.SmoothPixmapTransform, False)
+            painter.setTransform(
+                QTransform.fromTranslate(x, y).scale(
+                    width / source.width(),
+                    height / source.height()
+                )
+            )
+            painter.drawPixmap(0, 0, source)
+            painter.restore()
+        else:
+            if scaled_pixmap is None:
+                scaled_pixmap = source.scaled(
+                    width,
+                    height,
+                    Qt.IgnoreAspectRatio,
+                    Qt.SmoothTransformation
+                )
+                QPixmapCache.insert(key, scaled_pixmap)
+                self._scaled_keys.add(key)
+            painter.drawPixmap(x, y, scaled_pixmap)
         
         # Draw border
         painter.setPen(QColor(200, 200, 200))
-        painter.drawRect(x, y, scaled_pixmap.width(), scaled_pixmap.height())
+        painter.drawRect(QRect(x, y, width, height))
         
         # Draw label
         painter.setPen(QColor(80, 80, 80))
@@ -156,8 +292,16 @@ class ImagePreviewWidget(QWidget):
 
 class ChannelToggleWidget(QWidget):
     """Widget for toggling channel visibility"""
+    
+    channelsChanged = pyqtSignal(tuple)
+    
+    # Visibility bit per channel key
+    CHAN_BITS = {'C': 1, 'M': 2, 'Y': 4, 'K': 8, 'W': 16, 'RGB': 32}
+    
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._cached = None
+        self._mask = None
         
         self.channels = {
             'C': QCheckBox('Cyan'),
@@ -168,16 +312,14 @@ class ChannelToggleWidget(QWidget):
             'RGB': QCheckBox('RGB')
         }
         
-        # Set colors for channel labels
-        self.channels['C'].setStyleSheet("QCheckBox { color: #00ffff; }")
-        self.channels['M'].setStyleSheet("QCheckBox { color: #ff00ff; }")
-        self.channels['Y'].setStyleSheet("QCheckBox { color: #ffff00; }")
-        self.channels['K'].setStyleSheet("QCheckBox { color: #000000; }")
-        self.channels['W'].setStyleSheet("QCheckBox { color: #ffffff; background-color: #666666; }")
+        # Channel label colors come from QCheckBox#<key> in DTFMainWindow.STYLESHEET
+        for key, checkbox in self.channels.items():
+            checkbox.setObjectName(key)
         
         # Default: all checked
         for checkbox in self.channels.values():
             checkbox.setChecked(True)
+            checkbox.stateChanged.connect(self._invalidate)
         
         layout = QHBoxLayout()
         for checkbox in self.channels.values():
@@ -186,17 +328,133 @@ class ChannelToggleWidget(QWidget):
         
         self.setLayout(layout)
     
+    def _invalidate(self):
+        self._cached = None
+        self._mask = None
+        self.channelsChanged.emit(self.get_visible_channels())
+    
+    def get_visible_mask(self):
+        """Return visible channels as a CHAN_BITS bitmask (cached until a toggle changes)"""
+        if self._mask is None:
+            self._mask = sum(
+                bit for key, bit in self.CHAN_BITS.items()
+                if self.channels[key].isChecked()
+            )
+        return self._mask
+    
     def get_visible_channels(self):
-        """Return list of visible channel names"""
-        visible = []
-        for key, checkbox in self.channels.items():
-            if checkbox.isChecked():
-                visible.append(key.lower())
-        return visible
+        """Return tuple of visible channel names (derived from the mask)"""
+        if self._cached is None:
+            mask = self.get_visible_mask()
+            self._cached = tuple(
+                key.lower() for key, bit in self.CHAN_BITS.items() if mask & bit
+            )
+        return self._cached
 
 class DTFMainWindow(QMainWindow):
     """Main application window"""
     
+    # Zoom levels offered by the zoom combo, in order
+    ZOOM_FACTORS = (0.25, 0.5, 1.0, 2.0, 4.0)
+    
+    # Application style, parsed once for the whole widget tree
+    STYLESHEET = """
+        QMainWindow {
+            background-color: #f0f0f0;
+        }
+        
+        QGroupBox {
+            font-weight: bold;
+            border: 1px solid #cccccc;
+            border-radius: 4px;
+            margin-top: 10px;
+            padding-top: 10px;
+        }
+        
+        QGroupBox::title {
+            subcontrol-origin: margin;
+            left: 10px;
+            padding: 0 5px 0 5px;
+        }
+        
+        QLabel {
+            color: #333333;
+        }
+        
+        QProgressBar {
+            border: 1px solid #cccccc;
+            border-radius: 3px;
+            text-align: center;
+        }
+        
+        QProgressBar::chunk {
+            background-color: #4a86e8;
+            border-radius: 3px;
+        }
+        
+        QComboBox {
+            border: 1px solid #cccccc;
+            border-radius: 3px;
+            padding: 3px;
+            background-color: white;
+        }
+        
+        QComboBox:hover {
+            border-color: #4a86e8;
+        }
+        
+        QSlider::groove:horizontal {
+            height: 4px;
+            background: #dddddd;
+            border-radius: 2px;
+        }
+        
+        QSlider::handle:horizontal {
+            background: #4a86e8;
+            width: 16px;
+            height: 16px;
+            margin: -6px 0;
+            border-radius: 8px;
+        }
+        
+        QCheckBox {
+            spacing: 5px;
+        }
+        
+        QCheckBox::indicator {
+            width: 16px;
+            height: 16px;
+        }
+        
+        QPushButton#ModernButton {
+            background-color: #4a86e8;
+            color: white;
+            border: none;
+            border-radius: 4px;
+            padding: 6px 12px;
+            font-weight: bold;
+        }
+        
+        QPushButton#ModernButton:hover {
+            background-color: #3a76d8;
+        }
+        
+        QPushButton#ModernButton:pressed {
+            background-color: #2a66c8;
+        }
+        
+        QPushButton#ModernButton:disabled {
+            background-color: #cccccc;
+            color: #666666;
+        }
+        
+        QCheckBox#C { color: #00ffff; }
+        QCheckBox#M { color: #ff00ff; }
+        QCheckBox#Y { color: #ffff00; }
+        QCheckBox#K { color: #000000; }
+        QCheckBox#W { color: #ffffff; background-color: #666666; }
+    """
+    
     def __init__(self):
         super().__init__()
         
@@ -208,6 +466,16 @@ class DTFMainWindow(QMainWindow):
         self.current_image_path = None
         self.original_image = None
         self.processed_image = None
+        self._last_progress_message = None
+        self.worker_thread = None
+        self.load_thread = None
+        
+        # Settings changes are staged and applied once the controls settle
+        self._pending_cfg = {}
+        self._reproc_timer = QTimer(self)
+        self._reproc_timer.setSingleShot(True)
+        self._reproc_timer.setInterval(150)
+        self._reproc_timer.timeout.connect(self._apply_pending_config)
         
         self.init_ui()
         self.setWindowTitle("DTF Halftoner Pro")
@@ -349,6 +617,10 @@ class DTFMainWindow(QMainWindow):
         matrix_layout.addStretch()
         layout.addLayout(matrix_layout)
         
+        # Reprocess automatically after settings change
+        self.auto_process = QCheckBox("Reprocess on change")
+        layout.addWidget(self.auto_process)
+        
         group.setLayout(layout)
         return group
     
@@ -359,6 +631,7 @@ class DTFMainWindow(QMainWindow):
         
         # Channel toggles
         self.channel_toggles = ChannelToggleWidget()
+        self.channel_toggles.channelsChanged.connect(self.update_preview)
         layout.addWidget(self.channel_toggles)
         
         # Individual channel settings button
@@ -413,9 +686,9 @@ class DTFMainWindow(QMainWindow):
         # Zoom controls
         controls.addWidget(QLabel("Zoom:"))
         self.zoom_combo = QComboBox()
-        self.zoom_combo.addItems(["25%", "50%", "100%", "200%", "400%"])
-        self.zoom_combo.setCurrentText("100%")
-        self.zoom_combo.currentTextChanged.connect(self.update_zoom)
+        self.zoom_combo.addItems([f"{int(z * 100)}%" for z in self.ZOOM_FACTORS])
+        self.zoom_combo.setCurrentIndex(self.ZOOM_FACTORS.index(1.0))
+        self.zoom_combo.currentIndexChanged.connect(self.update_zoom)
         controls.addWidget(self.zoom_combo)
         
         # View mode
@@ -438,10 +711,10 @@ class DTFMainWindow(QMainWindow):
         # File menu
         file_menu = menubar.addMenu('File')
         
-        open_action = QAction('Open Image...', self)
-        open_action.setShortcut('Ctrl+O')
-        open_action.triggered.connect(self.load_image)
-        file_menu.addAction(open_action)
+        self.open_action = QAction('Open Image...', self)
+        self.open_action.setShortcut('Ctrl+O')
+        self.open_action.triggered.connect(self.load_image)
+        file_menu.addAction(self.open_action)
         
         save_action = QAction('Save Results...', self)
         save_action.setShortcut('Ctrl+S')
@@ -484,79 +757,27 @@ class DTFMainWindow(QMainWindow):
     
     def apply_stylesheet(self):
         """Apply custom stylesheet for modern look"""
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-            
-            QGroupBox {
-                font-weight: bold;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            
-            QLabel {
-                color: #333333;
-            }
-            
-            QProgressBar {
-                border: 1px solid #cccccc;
-                border-radius: 3px;
-                text-align: center;
-            }
-            
-            QProgressBar::chunk {
-                background-color: #4a86e8;
-                border-radius: 3px;
-            }
-            
-            QComboBox {
-                border: 1px solid #cccccc;
-                border-radius: 3px;
-                padding: 3px;
-                background-color: white;
-            }
-            
-            QComboBox:hover {
-                border-color: #4a86e8;
-            }
-            
-            QSlider::groove:horizontal {
-                height: 4px;
-                background: #dddddd;
-                border-radius: 2px;
-            }
-            
-            QSlider::handle:horizontal {
-                background: #4a86e8;
-                width: 16px;
-                height: 16px;
-                margin: -6px 0;
-                border-radius: 8px;
-            }
-            
-            QCheckBox {
-                spacing: 5px;
-            }
-            
-            QCheckBox::indicator {
-                width: 16px;
-                height: 16px;
-            }
-        """)
+        self.setStyleSheet(self.STYLESHEET)
     
     # ===== Event Handlers =====
     
+    def _thread_running(self, name):
+        thread = getattr(self, name)
+        return thread is not None and thread.isRunning()
+    
+    def _busy(self):
+        """
+        True while a load or processing thread runs. Only one may run at a
+        time: their threads must not be rebound while running, and Numba's
+        workqueue layer aborts when two threads launch parallel kernels.
+        """
+        return self._thread_running('load_thread') or self._thread_running('worker_thread')
+    
     def load_image(self):
         """Load image from file"""
+        if self._busy():
+            return
+        
         path, _ = QFileDialog.getOpenFileName(
             self,
             "Open Image",
@@ -566,35 +787,70 @@ class DTFMainWindow(QMainWindow):
         
         if path:
             self.current_image_path = path
+            self.load_btn.setEnabled(False)
+            self.open_action.setEnabled(False)
+            self.process_btn.setEnabled(False)
+            self.status_bar.showMessage(f"Loading: {os.path.basename(path)}...")
             
-            # Load and display image
-            self.original_image = self.processor.load_image(path)
-            if self.original_image is not None:
-                self.preview_widget.set_images(self.original_image, None)
-                
-                # Update image info
-                h, w, _ = self.original_image.shape
-                self.image_info.setText(
-                    f"<b>{os.path.basename(path)}</b><br>"
-                    f"Size: {w} × {h} pixels<br>"
-                    f"Mode: RGB"
-                )
-                
-                # Enable process button
-                self.process_btn.setEnabled(True)
-                
-                self.status_bar.showMessage(f"Loaded: {os.path.basename(path)}")
+            # Decode in separate thread to keep UI responsive
+            self.load_thread = QThread()
+            self.load_worker = LoadWorker(self.processor, path)
+            self.load_worker.moveToThread(self.load_thread)
+            
+            self.load_worker.finished.connect(self.on_image_loaded)
+            
+            self.load_thread.started.connect(self.load_worker.load)
+            self.load_thread.start()
+    
+    def on_image_loaded(self, image, path):
+        """Display a freshly loaded image"""
+        self.load_thread.quit()
+        self.load_thread.wait()
+        self.load_btn.setEnabled(True)
+        self.open_action.setEnabled(True)
+        
+        if image is None:
+            # The previous image (if any) can still be processed
+            self.process_btn.setEnabled(
+                self.original_image is not None and not self._thread_running('worker_thread')
+            )
+            self.status_bar.showMessage(f"Failed to load: {os.path.basename(path)}")
+            return
+        
+        self.original_image = image
+        self.preview_widget.set_images(self.original_image, None)
+        
+        # Update image info
+        h, w, _ = self.original_image.shape
+        self.image_info.setText(
+            f"<b>{os.path.basename(path)}</b><br>"
+            f"Size: {w} × {h} pixels<br>"
+            f"Mode: RGB"
+        )
+        
+        # Enable process button
+        self.process_btn.setEnabled(not self._thread_running('worker_thread'))
+        
+        self.status_bar.showMessage(f"Loaded: {os.path.basename(path)}")
     
     def process_image(self):
         """Process the loaded image"""
+        if self._busy():
+            return
+        
+        self._flush_pending_config()
+        
         if self.original_image is None:
             QMessageBox.warning(self, "Warning", "Please load an image first.")
             return
         
         # Disable UI during processing
         self.process_btn.setEnabled(False)
+        self.load_btn.setEnabled(False)
+        self.open_action.setEnabled(False)
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
+        self._last_progress_message = None
         
         # Process in separate thread to keep UI responsive
         self.worker_thread = QThread()
@@ -618,14 +874,18 @@ class DTFMainWindow(QMainWindow):
         total_steps = 8
         percentage = int((step / total_steps) * 100)
         self.progress_bar.setValue(percentage)
-        self.status_bar.showMessage(message)
+        
+        # Only touch the status bar when the text actually changes
+        if message != self._last_progress_message:
+            self._last_progress_message = message
+            self.status_bar.showMessage(message)
     
-    def on_processing_finished(self, result):
+    def on_processing_finished(self, preview):
         """Handle processing completion"""
         self.worker_thread.quit()
         self.worker_thread.wait()
         
-        self.processed_image = self.processor.create_preview()
+        self.processed_image = preview
         self.preview_widget.set_images(self.original_image, self.processed_image)
         
         # Enable save button
@@ -633,6 +893,8 @@ class DTFMainWindow(QMainWindow):
         
         # Reset UI
         self.process_btn.setEnabled(True)
+        self.load_btn.setEnabled(True)
+        self.open_action.setEnabled(True)
         self.progress_bar.setVisible(False)
         
         self.status_bar.showMessage("Processing complete!")
@@ -646,6 +908,8 @@ class DTFMainWindow(QMainWindow):
         
         # Reset UI
         self.process_btn.setEnabled(True)
+        self.load_btn.setEnabled(True)
+        self.open_action.setEnabled(True)
         self.progress_bar.setVisible(False)
         
         self.status_bar.showMessage("Processing failed")
@@ -699,16 +963,43 @@ class DTFMainWindow(QMainWindow):
         
         if path:
             try:
+                self._flush_pending_config()
                 self.config.save(path)
                 self.status_bar.showMessage(f"Settings exported to {path}")
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", str(e))
     
+    def _stage_config(self, name, value):
+        """Stage a config change; applied after 150 ms without further changes"""
+        self._pending_cfg[name] = value
+        self._reproc_timer.start()
+    
+    def _flush_pending_config(self):
+        """Write staged changes to the config; returns True if anything changed"""
+        changed = bool(self._pending_cfg)
+        for name, value in self._pending_cfg.items():
+            setattr(self.config, name, value)
+        self._pending_cfg.clear()
+        return changed
+    
+    def _apply_pending_config(self):
+        # Never change the config under a running job; retry once it is done.
+        # The worker thread outlives processor.is_processing (it still builds
+        # the preview), so the threads themselves are the guard.
+        if self._busy():
+            self._reproc_timer.start()
+            return
+        
+        if (self._flush_pending_config()
+                and self.auto_process.isChecked()
+                and self.original_image is not None):
+            self.process_image()
+    
     def update_dpi(self, value):
-        self.config.dpi = value
+        self._stage_config('dpi', value)
     
     def update_lpi(self, value):
-        self.config.lpi = value
+        self._stage_config('lpi', value)
     
     def update_method(self, text):
         mapping = {
@@ -716,11 +1007,11 @@ class DTFMainWindow(QMainWindow):
             "Error Diffusion": "error_diffusion",
             "Hybrid": "hybrid"
         }
-        self.config.method = mapping.get(text, "ordered")
+        self._stage_config('method', mapping.get(text, "ordered"))
     
     def update_matrix_size(self, index):
         sizes = {0: 4, 1: 8, 2: 16}
-        self.config.matrix_size = sizes.get(index, 8)
+        self._stage_config('matrix_size', sizes.get(index, 8))
     
     def update_white_method(self, text):
         mapping = {
@@ -728,20 +1019,15 @@ class DTFMainWindow(QMainWindow):
             "Halftone": "halftone",
             "Edge Enhanced": "edge_enhanced"
         }
-        self.config.white_method = mapping.get(text, "edge_enhanced")
+        self._stage_config('white_method', mapping.get(text, "edge_enhanced"))
     
     def update_threshold(self, value):
-        self.config.white_threshold = value / 100.0
+        self._stage_config('white_threshold', value / 100.0)
     
-    def update_zoom(self, text):
-        # Remove % sign and convert to float
-        zoom_str = text.replace('%', '')
-        try:
-            zoom = float(zoom_str) / 100.0
-            self.preview_widget.zoom_factor = zoom
-            self.preview_widget.update()
-        except ValueError:
-            pass
+    def update_zoom(self, index):
+        self.preview_widget.zoom_factor = self.ZOOM_FACTORS[index]
+        self.preview_widget.begin_interaction()
+        self.preview_widget.update()
     
     def update_view_mode(self, text):
         if text == "Original":
@@ -755,26 +1041,34 @@ class DTFMainWindow(QMainWindow):
     
     def update_preview(self):
         """Update preview based on current settings"""
-        if self.processed_image is not None:
+        if self.processed_image is None:
+            return
+        
+        results = self.processor.results
+        if self.preview_white.isChecked():
+            # White layer straight from the halftoned plane (grayscale)
+            self.preview_widget.set_images(self.original_image, results['white'])
+            return
+        
+        # A single visible process color is shown tinted with its ink
+        bits = ChannelToggleWidget.CHAN_BITS
+        names = {bits['C']: 'cyan', bits['M']: 'magenta', bits['Y']: 'yellow', bits['K']: 'black'}
+        process = self.channel_toggles.get_visible_mask() & (bits['C'] | bits['M'] | bits['Y'] | bits['K'])
+        if process in names:
+            name = names[process]
+            self.preview_widget.set_images(self.original_image, results[name], tint=name)
+        else:
             self.preview_widget.set_images(self.original_image, self.processed_image)
     
     def zoom_in(self):
         """Zoom in preview"""
-        current_text = self.zoom_combo.currentText()
-        zoom_levels = ["25%", "50%", "100%", "200%", "400%"]
-        
-        current_index = zoom_levels.index(current_text)
-        if current_index < len(zoom_levels) - 1:
-            self.zoom_combo.setCurrentText(zoom_levels[current_index + 1])
+        index = self.zoom_combo.currentIndex()
+        self.zoom_combo.setCurrentIndex(min(index + 1, len(self.ZOOM_FACTORS) - 1))
     
     def zoom_out(self):
         """Zoom out preview"""
-        current_text = self.zoom_combo.currentText()
-        zoom_levels = ["25%", "50%", "100%", "200%", "400%"]
-        
-        current_index = zoom_levels.index(current_text)
-        if current_index > 0:
-            self.zoom_combo.setCurrentText(zoom_levels[current_index - 1])
+        index = self.zoom_combo.currentIndex()
+        self.zoom_combo.setCurrentIndex(max(index - 1, 0))
     
     def show_channel_settings(self):
         """Show channel settings dialog"""
@@ -806,9 +1100,11 @@ class DTFMainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         # Clean up resources
-        if hasattr(self, 'worker_thread'):
-            self.worker_thread.quit()
-            self.worker_thread.wait()
+        for name in ('worker_thread', 'load_thread'):
+            thread = getattr(self, name, None)
+            if thread is not None:
+                thread.quit()
+                thread.wait()
         
         event.accept()
 
@@ -819,24 +1115,47 @@ class ProcessingWorker(QObject):
     finished = pyqtSignal(object)
     error = pyqtSignal(str)
     
+    # Cross-thread progress updates are limited to ~30 per second
+    PROGRESS_INTERVAL = 1.0 / 30.0
+    
     def __init__(self, processor, image):
         super().__init__()
         self.processor = processor
         self.image = image
+        self._last_emit = 0.0
     
     def process(self):
         """Process image (runs in separate thread)"""
         try:
-            # Process with progress callback
+            # Process with throttled progress callback; the last step always goes through
             def progress_callback(step, message):
-                self.progress.emit(step, message)
+                now = time.monotonic()
+                if (now - self._last_emit >= self.PROGRESS_INTERVAL
+                        or step >= self.processor.total_steps):
+                    self.progress.emit(step, message)
+                    self._last_emit = now
             
-            result = self.processor.process(
+            self.processor.process(
                 self.image,
                 progress_callback=progress_callback
             )
             
-            self.finished.emit(result)
+            # Build the preview here too, off the GUI thread
+            self.finished.emit(self.processor.create_preview())
             
         except Exception as e:
-            self.error.emit(str(e))
\ No newline at end of file
+            self.error.emit(str(e))
+
+class LoadWorker(QObject):
+    """Worker for decoding images in separate thread"""
+    
+    finished = pyqtSignal(object, str)
+    
+    def __init__(self, processor, path):
+        super().__init__()
+        self.processor = processor
+        self.path = path
+    
+    def load(self):
+        """Load image (runs in separate thread); emits None on failure"""
+        self.finished.emit(self.processor.load_image(self.path), self.path)
\ No newline at end of file
@@ -0,0 +1,324 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from PIL import Image
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from core.aot import AOTKernel
+from core.color_separation import APPLY_LUT_SIG, DTFColorSeparator, _apply_lut_kernel, _build_dg_lut
+from core.config import DTFConfig
+from core.halftone_algorithms import HalftoneAlgorithms
+from core.processor import DTFProcessor, _composite_white
+from core import simple_halftone
+
+
+def reference_floyd_steinberg(channel):
+    """Plain serial Floyd-Steinberg used as the ground truth"""
+    h, w = channel.shape
+    output = channel.astype(np.float32)
+    for y in range(h):
+        for x in range(w):
+            old_pixel = output[y, x]
+            new_pixel = np.float32(255.0 if old_pixel > 127.5 else 0.0)
+            output[y, x] = new_pixel
+            error = old_pixel - new_pixel
+            if x + 1 < w:
+                output[y, x + 1] += error * 7.0 / 16.0
+            if y + 1 < h:
+                if x > 0:
+                    output[y + 1, x - 1] += error * 3.0 / 16.0
+                output[y + 1, x] += error * 5.0 / 16.0
+                if x + 1 < w:
+                    output[y + 1, x + 1] += error * 1.0 / 16.0
+    return np.clip(output, 0, 255).astype(np.uint8)
+
+
+def test_floyd_steinberg_matches_serial():
+    rng = np.random.default_rng(0)
+    for shape in [(1, 1), (7, 3), (130, 257)]:
+        channel = rng.integers(0, 256, shape, dtype=np.uint8)
+        result = HalftoneAlgorithms.floyd_steinberg(channel)
+        assert np.array_equal(result, reference_floyd_steinberg(channel))
+
+
+def test_floyd_steinberg_is_binary():
+    channel = np.tile(np.arange(256, dtype=np.uint8), (64, 1))
+    result = HalftoneAlgorithms.floyd_steinberg(channel)
+    assert result.dtype == np.uint8
+    assert set(np.unique(result)).issubset({0, 255})
+
+
+def test_rgb_to_cmyk_respects_ink_limit():
+    rng = np.random.default_rng(1)
+    rgb = rng.integers(0, 256, (64, 80, 3), dtype=np.uint8)
+    rgb[0, 0] = [255, 255, 255]
+    config = DTFConfig(total_ink_limit=200.0)
+    
+    planes = DTFColorSeparator(config).rgb_to_cmyk(rgb)
+    
+    assert len(planes) == 4
+    for plane in planes:
+        assert plane.shape == (64, 80) and plane.dtype == np.uint8
+        assert plane.flags.c_contiguous
+        assert plane[0, 0] == 0
+    total = sum(plane.astype(np.int32) for plane in planes)
+    assert total.max() <= 2 * 255 + 4
+
+
+def test_bayer_matrix_is_permutation():
+    for size in (2, 4, 8, 16):
+        matrix = HalftoneAlgorithms.bayer_matrix(size)
+        levels = np.sort((matrix * size * size).ravel())
+        assert np.array_equal(levels, np.arange(size * size))
+
+
+def test_ordered_dither_rotation_preserves_tone():
+    channel = np.full((128, 128), 96, dtype=np.uint8)
+    for angle in (0.0, 15.0, 45.0, 75.0):
+        result = HalftoneAlgorithms.ordered_dither(channel, matrix_size=8, angle=angle)
+        assert set(np.unique(result)).issubset({0, 255})
+        assert abs(result.mean() - 96) < 12
+
+
+def test_threshold_tile_is_seamless():
+    for matrix_size in (4, 8, 16):
+        for angle in (15.0, 30.0, 45.0, 75.0):
+            tile = HalftoneAlgorithms.threshold_tile(matrix_size, angle)
+            size = tile.shape[0]
+            
+            # The screen continues across the tile edge without a seam
+            p = int(round(16 * np.cos(np.deg2rad(angle))))
+            q = int(round(16 * np.sin(np.deg2rad(angle))))
+            y, x = np.mgrid[0:2 * size, 0:2 * size]
+            u = ((p * x + q * y) // 16) % matrix_size
+            v = ((p * y - q * x) // 16) % matrix_size
+            screen = (HalftoneAlgorithms.bayer_matrix(matrix_size) * np.float32(255.0))[v, u]
+            assert np.array_equal(np.tile(tile, (2, 2)), screen.astype(np.uint8))
+
+
+def test_hybrid_halftone_splits_tonal_ranges():
+    channel = np.tile(np.arange(256, dtype=np.uint8), (64, 1))
+    result = HalftoneAlgorithms.hybrid_halftone(channel, angle=0.0)
+    
+    assert result.shape == channel.shape
+    assert set(np.unique(result)).issubset({0, 255})
+    
+    # Midtones follow the unrotated Bayer screen exactly
+    screen = np.tile(HalftoneAlgorithms.bayer_matrix(8) * 255.0, (8, 32))
+    midtones = (channel >= 0.2 * 255) & (channel <= 0.8 * 255)
+    expected = np.where(channel > screen, 255, 0)
+    assert np.array_equal(result[midtones], expected[midtones])
+
+
+def test_white_layer_thresholds_bt601_luma():
+    rng = np.random.default_rng(2)
+    rgb = rng.integers(0, 256, (48, 64, 3), dtype=np.uint8)
+    r, g, b = rgb.astype(np.int32).transpose(2, 0, 1)
+    luma = (77 * r + 150 * g + 29 * b) >> 8
+    separator = DTFColorSeparator(DTFConfig())
+    
+    for method, limit in (("full", 250), ("halftone", 179)):
+        white = separator.generate_white_layer(rgb, method)
+        assert white.dtype == np.uint8
+        assert np.array_equal(white, np.where(luma < limit, 255, 0))
+
+
+def test_aot_dispatch_rejects_strided_arrays():
+    kernel = AOTKernel("apply_lut_kernel", _apply_lut_kernel, APPLY_LUT_SIG)
+    channel = np.zeros((16, 8), dtype=np.uint8)
+    lut = _build_dg_lut(40)
+    wide = np.zeros((16, 16), dtype=np.uint8)
+    
+    assert kernel._fits_aot((channel, lut, np.empty_like(channel)))
+    assert not kernel._fits_aot((channel, lut, wide[:, ::2]))
+    assert not kernel._fits_aot((channel.astype(np.int16), lut, np.empty_like(channel)))
+
+
+def test_dot_gain_writes_into_strided_out():
+    rng = np.random.default_rng(3)
+    channel = rng.integers(0, 256, (32, 24), dtype=np.uint8)
+    separator = DTFColorSeparator(DTFConfig())
+    expected = separator.apply_dot_gain_compensation(channel, 0.15)
+    
+    wide = np.zeros((32, 48), dtype=np.uint8)
+    result = separator.apply_dot_gain_compensation(channel, 0.15, out=wide[:, ::2])
+    
+    assert np.array_equal(result, expected)
+    assert np.array_equal(wide[:, ::2], expected)
+    assert not wide[:, 1::2].any()
+    
+    with pytest.raises(ValueError):
+        separator.apply_dot_gain_compensation(channel, 0.15, out=np.empty((32, 23), np.uint8))
+
+
+@pytest.mark.parametrize("black_generation", ["GCR", "UCR"])
+def test_tiled_pipeline_matches_stage_by_stage(black_generation):
+    rng = np.random.default_rng(4)
+    rgb = rng.integers(0, 256, (300, 517, 3), dtype=np.uint8)
+    config = DTFConfig(method="ordered", black_generation=black_generation,
+                       dot_gain=0.15, white_method="full")
+    processor = DTFProcessor(config)
+    
+    tiled = processor._process_tiled(rgb)
+    staged = processor._process_channels(rgb)
+    
+    assert list(tiled) == list(staged)
+    for name in staged:
+        assert np.array_equal(tiled[name], staged[name]), name
+
+
+def test_composite_white_matches_pil_paste():
+    rng = np.random.default_rng(5)
+    rgba = rng.integers(0, 256, (40, 60, 4), dtype=np.uint8)
+    rgba[:, :20, 3] = 0
+    rgba[:, 20:40, 3] = 255
+    rgba[0, 40:, 3] = [1, 127, 128, 254] * 5
+    
+    out = np.empty((40, 60, 3), dtype=np.uint8)
+    _composite_white(rgba, out)
+    
+    image = Image.fromarray(rgba, "RGBA")
+    expected = Image.new("RGB", image.size, (255, 255, 255))
+    expected.paste(image, mask=image.getchannel("A"))
+    assert np.array_equal(out, np.asarray(expected))
+
+
+def composite_on_white(image):
+    """PIL reference for flattening transparency onto white"""
+    rgba = image.convert("RGBA")
+    flat = Image.new("RGB", rgba.size, (255, 255, 255))
+    flat.paste(rgba, mask=rgba.getchannel("A"))
+    return np.asarray(flat)
+
+
+@pytest.mark.parametrize("use_cv2", [True, False])
+def test_load_image_rgb_and_rgba(tmp_path, monkeypatch, use_cv2):
+    import core.processor as processor_module
+    if use_cv2:
+        pytest.importorskip("cv2")
+    else:
+        monkeypatch.setattr(processor_module, "cv2", None)
+    
+    rng = np.random.default_rng(6)
+    rgb = rng.integers(0, 256, (20, 30, 3), dtype=np.uint8)
+    rgba = rng.integers(0, 256, (20, 30, 4), dtype=np.uint8)
+    Image.fromarray(rgb).save(tmp_path / "rgb.png")
+    Image.fromarray(rgba).save(tmp_path / "rgba.png")
+    processor = DTFProcessor(DTFConfig())
+    
+    for name, expected in (("rgb.png", rgb), ("rgba.png", composite_on_white(Image.fromarray(rgba)))):
+        loaded = processor.load_image(str(tmp_path / name))
+        assert loaded.dtype == np.uint8 and loaded.flags.c_contiguous
+        assert np.array_equal(loaded, expected), name
+
+
+def test_load_image_16_bit_falls_back_to_pil(tmp_path):
+    cv2 = pytest.importorskip("cv2")
+    rgb16 = np.random.default_rng(7).integers(0, 65536, (20, 30, 3), dtype=np.uint16)
+    path = str(tmp_path / "deep.png")
+    cv2.imwrite(path, rgb16)
+    
+    loaded = DTFProcessor(DTFConfig()).load_image(path)
+    
+    assert loaded.dtype == np.uint8 and loaded.shape == (20, 30, 3)
+    assert np.array_equal(loaded, np.asarray(Image.open(path).convert("RGB")))
+
+
+def test_load_image_composites_la_and_palette_transparency(tmp_path):
+    pytest.importorskip("cv2")
+    rng = np.random.default_rng(8)
+    la = Image.fromarray(rng.integers(0, 256, (20, 30, 2), dtype=np.uint8), "LA")
+    palette = Image.fromarray(rng.integers(0, 4, (20, 30), dtype=np.uint8), "P")
+    palette.putpalette([255, 0, 0, 0, 255, 0, 0, 0, 255, 9, 9, 9])
+    la.save(tmp_path / "la.png")
+    palette.save(tmp_path / "palette.png", transparency=bytes([0, 128, 255, 255]))
+    processor = DTFProcessor(DTFConfig())
+    
+    for name in ("la.png", "palette.png"):
+        loaded = processor.load_image(str(tmp_path / name))
+        assert np.array_equal(loaded, composite_on_white(Image.open(tmp_path / name))), name
+
+
+def run_simple_halftone(monkeypatch, use_numba, rgb):
+    """simple_halftone outputs through the Numba kernels or the NumPy fallback"""
+    if not use_numba:
+        monkeypatch.setattr(simple_halftone, "njit", None)
+    outputs = (
+        simple_halftone.rgb_to_cmyk(rgb),
+        simple_halftone.generate_white_layer(rgb),
+        simple_halftone.ordered_dither(rgb[:, :, 0]),
+        simple_halftone.ordered_dither(rgb[::2, ::3, 1], matrix_size=4),
+    )
+    monkeypatch.undo()
+    return outputs
+
+
+def test_simple_halftone_numba_matches_numpy(monkeypatch):
+    if simple_halftone.njit is None:
+        pytest.skip("Numba not installed")
+    rng = np.random.default_rng(9)
+    rgb = rng.integers(0, 256, (67, 131, 3), dtype=np.uint8)
+    rgb[0, :4] = [[0, 0, 0], [255, 255, 255], [255, 0, 0], [1, 0, 0]]
+    
+    jit = run_simple_halftone(monkeypatch, True, rgb)
+    fallback = run_simple_halftone(monkeypatch, False, rgb)
+    
+    for a, b in zip(jit, fallback):
+        assert a.dtype == b.dtype == np.uint8
+        assert np.array_equal(a, b)
+
+
+def test_simple_halftone_matches_float_reference(monkeypatch):
+    rng = np.random.default_rng(10)
+    rgb = rng.integers(0, 256, (40, 56, 3), dtype=np.uint8)
+    
+    for use_numba in [False] + [True] * (simple_halftone.njit is not None):
+        cmyk, white, dithered, _ = run_simple_halftone(monkeypatch, use_numba, rgb)
+        
+        # CMYK within one level of the float formula
+        rgb_f = rgb.astype(np.float64) / 255.0
+        k = 1.0 - rgb_f.max(axis=2)
+        cmy = (1.0 - rgb_f - k[..., None]) / np.maximum(1.0 - k, 1e-6)[..., None]
+        expected = np.dstack([cmy, k]) * 255.0
+        assert np.abs(cmyk.astype(np.float64) - expected).max() <= 1.0
+        
+        r, g, b = rgb.astype(np.int32).transpose(2, 0, 1)
+        assert np.array_equal(white, np.where((77 * r + 150 * g + 29 * b) >> 8 < 250, 255, 0))
+        
+        # The uint8 _bayer thresholds dither exactly like the float matrix
+        screen = np.tile(HalftoneAlgorithms.bayer_matrix(8) * np.float32(255.0), (5, 7))
+        assert np.array_equal(dithered, np.where(rgb[:, :, 0] > screen, 255, 0))
+
+
+def reference_preview(results):
+    """Float channel mixing that create_preview used before the Numba kernel"""
+    h, w = results['cyan'].shape
+    preview = np.zeros((h, w, 3), dtype=np.float32)
+    for index, name in enumerate(('cyan', 'magenta', 'yellow')):
+        preview[:, :, index] += 1 - results[name].astype(np.float32) / 255.0
+    preview += (results['white'].astype(np.float32) / 255.0 * 0.3)[:, :, np.newaxis]
+    return (np.clip(preview, 0, 1) * 255).astype(np.uint8)
+
+
+def test_create_preview_matches_float_mixing():
+    # Every on/off combination of C, M, Y, K and W, one per column
+    bits = (np.arange(32)[:, None] >> np.arange(5)) & 1
+    planes = np.repeat(bits.T[:, None, :] * 255, 3, axis=1).astype(np.uint8)
+    processor = DTFProcessor(DTFConfig())
+    processor.results = dict(zip(('cyan', 'magenta', 'yellow', 'black', 'white'), planes))
+    
+    preview = processor.create_preview()
+    
+    assert preview.dtype == np.uint8 and preview.shape == (3, 32, 3)
+    assert np.array_equal(preview, reference_preview(processor.results))
+    
+    # Continuous-tone planes stay within one level of the float mixing
+    rng = np.random.default_rng(11)
+    processor.results = {name: rng.integers(0, 256, (24, 40), dtype=np.uint8)
+                         for name in ('cyan', 'magenta', 'yellow', 'black', 'white')}
+    difference = processor.create_preview().astype(np.int32) - reference_preview(processor.results)
+    assert np.abs(difference).max() <= 1